@@ -1,8 +1,15 @@
+import asyncio
+import os
+import pickle
 import time
 import traceback
 from dataclasses import dataclass
 from typing import List, Callable, Dict, Any
 
+# Full tracebacks are only formatted when debugging; walking the frame stack
+# on every failed action is expensive and the text just bloats the next prompt.
+_DEBUG = bool(os.getenv("AGENT_DEBUG"))
+
 # 1- Goal Class
 # Creates a simple container to hold information about what the agent should accomplish
 # priority: How important this goal is (lower numbers = higher priority)
@@ -33,9 +40,23 @@ class Action:
                  terminal: bool = False):
         self.name = name
         self.function = function
-        self.description = description
+        # Truncate to the LLM limit exactly once at registration; slicing an
+        # already-short string would still allocate a new copy every turn
+        self.description = description if len(description) <= 1024 else description[:1024]
         self.terminal = terminal
         self.parameters = parameters
+        # Precompiled OpenAI-style tool definition. Name/description/parameters
+        # are immutable after registration, so this dict is built exactly once.
+        # Kept a plain dict because downstream code type-checks with
+        # isinstance(tool, dict).
+        self.openai_tool_def = {
+            "type": "function",
+            "function": {
+                "name": name,
+                "description": self.description,
+                "parameters": parameters,
+            }
+        }
 
     def execute(self, **args) -> Any:
         """Execute the action's function"""
@@ -46,19 +67,43 @@ class Action:
 class ActionRegistry:
     def __init__(self):
         self.actions = {}
+        self._formatted_tools_cache = None
+        self._actions_tuple = None
 
     def register(self, action: Action):
         self.actions[action.name] = action
+        # Invalidate cached tool defs and the frozen action tuple
+        self._formatted_tools_cache = None
+        self._actions_tuple = None
+
+    # Freezes the registry once registration is complete so get_actions can
+    # hand out the same tuple every turn instead of copying the dict values
+    def finalize(self):
+        """Freeze the registered actions for cheap repeated iteration"""
+        self._actions_tuple = tuple(self.actions.values())
 
     # Looks up an action by its name
     def get_action(self, name: str) -> Action | None:
         return self.actions.get(name, None)
 
-    # Returns ALL actions as a list
+    # Returns ALL actions, as a frozen tuple once finalized
     def get_actions(self) -> List[Action]:
         """Get all registered actions"""
+        if self._actions_tuple is not None:
+            return self._actions_tuple
         return list(self.actions.values())
 
+    # Returns the actions in OpenAI function-calling format, built once.
+    # The registry is static after startup, so the list can be cached and
+    # reused across turns instead of being rebuilt in every prompt.
+    def get_formatted_tools(self) -> List[Dict]:
+        """Get all registered actions as LLM tool definitions (cached)"""
+        if self._formatted_tools_cache is None:
+            self._formatted_tools_cache = [
+                action.openai_tool_def for action in self.actions.values()
+            ]
+        return self._formatted_tools_cache
+
 
 
 # 3- Memory Class
@@ -67,24 +112,51 @@ class ActionRegistry:
 # Each item will be a dictionary representing one piece of the conversation
 class Memory:
     def __init__(self):
-        self.items = []  # Basic conversation history
+        self.items = []  # Basic conversation history (raw dicts)
+        self._nonsys_items = []  # Same items minus system messages, kept in sync
 
     # Adds a new memory item to the end of the list
     def add_memory(self, memory: dict):
         """Add memory to working memory"""
         self.items.append(memory)
+        # Track non-system items at write time so filtered copies are a plain
+        # slice instead of a full O(N) scan per call
+        if memory["type"] != "system":
+            self._nonsys_items.append(memory)
 
     # Returns the stored memories as a list
     def get_memories(self, limit: int = None) -> List[Dict]:
-        """Get formatted conversation history for prompt"""
+        """Get formatted conversation history for prompt.
+
+        With no limit this returns the underlying list without copying;
+        callers must treat the result as read-only.
+        """
+        if limit is None:
+            return self.items
         return self.items[:limit]
 
+    # Binary session persistence. Pickle protocol 5 keeps snapshots small and
+    # avoids JSON parse cost when resuming a session.
+    def dump(self, path: str):
+        """Snapshot the conversation history to a binary file"""
+        with open(path, "wb") as f:
+            pickle.dump(self.items, f, protocol=5)
+
+    @classmethod
+    def load(cls, path: str):
+        """Restore a Memory from a snapshot written by dump"""
+        memory = cls()
+        with open(path, "rb") as f:
+            for item in pickle.load(f):
+                memory.add_memory(item)
+        return memory
+
     # Creates a new Memory object with system messages filtered out
     def copy_without_system_memories(self):
         """Return a copy of the memory without system memories"""
-        filtered_items = [m for m in self.items if m["type"] != "system"]
         memory = Memory()
-        memory.items = filtered_items
+        for m in self._nonsys_items:
+            memory.add_memory(m)
         return memory
 
 
@@ -96,6 +168,25 @@ class Memory:
 # If it works: calls self.format_result() to package the result nicely
 # If it fails: catches the error and returns error information instead of crashing
 class Environment:
+    def execute_actions(self, invocations: List[tuple]) -> List[dict]:
+        """Execute several independent actions, concurrently when more than one.
+
+        The tools are mostly file I/O, so running them in threads via
+        asyncio.gather overlaps their wait time; a single action takes the
+        plain synchronous path.
+        """
+        if len(invocations) == 1:
+            action, args = invocations[0]
+            return [self.execute_action(action, args)]
+
+        async def _gather():
+            return await asyncio.gather(*[
+                asyncio.to_thread(self.execute_action, action, args)
+                for action, args in invocations
+            ])
+
+        return list(asyncio.run(_gather()))
+
     def execute_action(self, action: Action, args: dict) -> dict:
         """Execute an action and return the result."""
         try:
@@ -105,7 +196,7 @@ class Environment:
             return {
                 "tool_executed": False,
                 "error": str(e),
-                "traceback": traceback.format_exc()
+                "traceback": traceback.format_exc() if _DEBUG else None
             }
 
     def format_result(self, result: Any) -> dict:
@@ -23,31 +23,36 @@ class Agent:
     def construct_prompt(self, goals: List[Goal], memory: Memory, actions: ActionRegistry) -> Prompt:
         """Build prompt with memory context"""
         return self.agent_language.construct_prompt(
-            actions=actions.get_actions(),
+            actions=actions,
             environment=self.environment,
             goals=goals,
             memory=memory
         )
 
+    def get_invocations(self, response) -> list:
+        """Resolve every tool call in the response to (action, invocation) pairs"""
+        parsed = self.agent_language.parse_response(response)
+        invocations = parsed if isinstance(parsed, list) else [parsed]
+        return [(self.actions.get_action(inv["tool"]), inv) for inv in invocations]
+
     def get_action(self, response):
-        invocation = self.agent_language.parse_response(response)
-        action = self.actions.get_action(invocation["tool"])
-        return action, invocation
+        return self.get_invocations(response)[0]
 
     def should_terminate(self, response: str) -> bool:
-        action_def, _ = self.get_action(response)
-        return action_def.terminal
+        return any(action.terminal for action, _ in self.get_invocations(response))
 
     def set_current_task(self, memory: Memory, task: str):
         memory.add_memory({"type": "user", "content": task})
 
-    def update_memory(self, memory: Memory, response: str, result: dict):
+    def update_memory(self, memory: Memory, response: str, result):
         """
         Update memory with the agent's decision and the environment's response.
+        Accepts a single result dict or a list of results from a batched turn.
         """
-        new_memories = [
-            {"type": "assistant", "content": response},
-            {"type": "environment", "content": json.dumps(result)}
+        results = result if isinstance(result, list) else [result]
+        new_memories = [{"type": "assistant", "content": response}]
+        new_memories += [
+            {"type": "environment", "content": json.dumps(r)} for r in results
         ]
         for m in new_memories:
             memory.add_memory(m)
@@ -72,15 +77,17 @@ class Agent:
             response = self.prompt_llm_for_action(prompt)
             print(f"Agent Decision: {response}")
 
-            # Determine which action the agent wants to execute
-            action, invocation = self.get_action(response)
+            # Determine which action(s) the agent wants to execute
+            invocations = self.get_invocations(response)
 
-            # Execute the action in the environment
-            result = self.environment.execute_action(action, invocation["args"])
-            print(f"Action Result: {result}")
+            # Execute the actions in the environment (concurrently if several)
+            results = self.environment.execute_actions(
+                [(action, invocation["args"]) for action, invocation in invocations]
+            )
+            print(f"Action Result: {results if len(results) > 1 else results[0]}")
 
             # Update the agent's memory with information about what happened
-            self.update_memory(memory, response, result)
+            self.update_memory(memory, response, results)
 
             # Check if the agent has decided to terminate
             if self.should_terminate(response):
@@ -1,59 +1,19 @@
-import json
-from typing import List, Any
+import orjson
+from functools import lru_cache
+from typing import Any, ClassVar, List
 from response_generator import Prompt
 from tool_registry import tools
 from GAME import Goal, Action, ActionRegistry, Memory, Environment
 
-# What this class do?
-# Example: user_input = "Write a README for this project."
-# What construct_prompt Does:
-# The agent takes that simple user input and builds a complex prompt that includes:
-# System instructions (the goals), Conversation history, Available tools, The user's request
-# Prompt(
-#     messages=[
-#         {"role": "system", "content": "Goal: Read each file..."},
-#         {"role": "user", "content": "Write a README for this project."},
-#         {"role": "assistant", "content": '{"tool": "list_files", "args": {}}'},
-#         {"role": "user", "content": "Tool result: [file1.py, file2.py]"}
-#     ],
-#     tools=[list_files_tool, read_file_tool, terminate_tool]
-# )
-
-class AgentLanguage:
-    def __init__(self):
-        pass
-
-    def construct_prompt(self,
-                         actions: List[Action],
-                         environment: Environment,
-                         goals: List[Goal],
-                         memory: Memory) -> Prompt:
-        raise NotImplementedError("Subclasses must implement this method")
-
-    def parse_response(self, response: str) -> dict:
-        raise NotImplementedError("Subclasses must implement this method")
-
-
-
-class AgentFunctionCallingActionLanguage(AgentLanguage):
-
-    def __init__(self):
-        super().__init__()
-
-    def format_goals(self, goals: List[Goal]) -> List:
-        # Map all goals to a single string that concatenates their description
-        # and combine into a single message of type system
-        sep = "\n-------------------\n"
-        goal_instructions = "\n\n".join([f"{goal.name}:{sep}{goal.description}{sep}" for goal in goals])
-        
-        # Add comprehensive tool selection guidance
-        tool_selection_guide = """
+# Static guidance appended to every system message. Kept at module level so
+# format_goals does not rebuild this multi-kilobyte literal on every turn.
+TOOL_SELECTION_GUIDE = """
 CRITICAL TOOL SELECTION GUIDELINES:
 =================================
 
 🎯 CENTER-SPECIFIC FILE QUERIES:
 - "how many files from [center]" → count_center_csv_files(center_keyword="[center]", path="...")
-- "count files from [center]" → count_center_csv_files(center_keyword="[center]", path="...")  
+- "count files from [center]" → count_center_csv_files(center_keyword="[center]", path="...")
 - "list files from [center]" → list_center_csv_files(center_keyword="[center]", path="...")
 - "show [center] files" → list_center_csv_files(center_keyword="[center]", path="...")
 
@@ -92,9 +52,81 @@ CRITICAL TOOL SELECTION GUIDELINES:
 - If the conversation is clearly finished and the user has expressed satisfaction or intent to end.
 =================================
 """
-        
+
+
+# Memory-type → chat-role mapping for format_memory's hot loop. Environment
+# results also map to user messages (for Cohere compatibility) but get a
+# "Tool result:" prefix, handled separately below.
+_ROLE_MAP = {"assistant": "assistant", "environment": "user"}
+
+
+@lru_cache(maxsize=16)
+def _build_system_message(goals_key: tuple, guide: str) -> str:
+    """Join the goal descriptions and append the tool-selection guide.
+
+    Cached because the goals are frozen dataclasses that never change within a
+    session, so the joined string can be reused across turns.
+    """
+    sep = "\n-------------------\n"
+    goal_instructions = "\n\n".join([f"{goal.name}:{sep}{goal.description}{sep}" for goal in goals_key])
+    return goal_instructions + "\n\n" + guide
+
+# What this class do?
+# Example: user_input = "Write a README for this project."
+# What construct_prompt Does:
+# The agent takes that simple user input and builds a complex prompt that includes:
+# System instructions (the goals), Conversation history, Available tools, The user's request
+# Prompt(
+#     messages=[
+#         {"role": "system", "content": "Goal: Read each file..."},
+#         {"role": "user", "content": "Write a README for this project."},
+#         {"role": "assistant", "content": '{"tool": "list_files", "args": {}}'},
+#         {"role": "user", "content": "Tool result: [file1.py, file2.py]"}
+#     ],
+#     tools=[list_files_tool, read_file_tool, terminate_tool]
+# )
+
+class AgentLanguage:
+    def __init__(self):
+        pass
+
+    def construct_prompt(self,
+                         actions: ActionRegistry | List[Action],
+                         environment: Environment,
+                         goals: List[Goal],
+                         memory: Memory) -> Prompt:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def parse_response(self, response: str) -> dict:
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+
+class AgentFunctionCallingActionLanguage(AgentLanguage):
+
+    # Variants of this language only differ in the guide text and the tool
+    # used when the LLM returns plain text, so they can subclass and override
+    # these instead of duplicating the whole class.
+    GUIDE: ClassVar[str] = TOOL_SELECTION_GUIDE
+    FALLBACK_TOOL: ClassVar[str] = "say"
+
+    def __init__(self):
+        super().__init__()
+        # Hot-path specialization: tools never change mid-session, so after
+        # the first turn construct_prompt reuses the prebuilt tool list and
+        # only reformats the (cached) goals and the memory.
+        self._static_parts = None  # (registry_id, tools)
+
+    def format_goals(self, goals: List[Goal]) -> List:
+        # Map all goals to a single string that concatenates their description
+        # and combine into a single message of type system.
+        # Goal is a frozen dataclass (hashable), so the tuple of goals can key
+        # the cached builder directly. The full guide goes in every prompt:
+        # each LLM call is stateless and rebuilt from memory, so earlier
+        # turns' system messages are not part of the request.
+        goals_key = tuple(goals)
         return [
-            {"role": "system", "content": goal_instructions + "\n\n" + tool_selection_guide}
+            {"role": "system", "content": _build_system_message(goals_key, self.GUIDE)}
         ]
 
     def format_memory(self, memory: Memory) -> List:
@@ -102,50 +134,45 @@ CRITICAL TOOL SELECTION GUIDELINES:
         items = memory.get_memories()
         mapped_items = []
         for item in items:
-
-            content = item.get("content", None)
-            if not content:
-                content = json.dumps(item, indent=4)
-
-            if item["type"] == "assistant":
-                mapped_items.append({"role": "assistant", "content": content})
-            elif item["type"] == "environment":
-                # Map environment results to user messages for Cohere compatibility
-                mapped_items.append({"role": "user", "content": f"Tool result: {content}"})
-            else:
-                mapped_items.append({"role": "user", "content": content})
+            item_type = item["type"]
+            content = item.get("content") or orjson.dumps(item, option=orjson.OPT_INDENT_2).decode()
+            if item_type == "environment":
+                content = f"Tool result: {content}"
+            mapped_items.append({"role": _ROLE_MAP.get(item_type, "user"), "content": content})
 
         return mapped_items
 
     def format_actions(self, actions: List[Action]) -> List:
         """Convert actions to LangChain-compatible tool format"""
-
-        tools = []
-        for action in actions:
-            # Convert to OpenAI function format that LangChain can use
-            tool_def = {
-                "type": "function",
-                "function": {
-                    "name": action.name,
-                    "description": action.description[:1024],
-                    "parameters": action.parameters,
-                }
-            }
-            tools.append(tool_def)
-
-        return tools
+        # Each Action precompiles its OpenAI-format definition at registration,
+        # so this is a simple attribute gather rather than dict construction.
+        return [action.openai_tool_def for action in actions]
 
     def construct_prompt(self,
-                         actions: List[Action],
+                         actions: ActionRegistry | List[Action],
                          environment: Environment,
                          goals: List[Goal],
                          memory: Memory) -> Prompt:
 
-        prompt = []
-        prompt += self.format_goals(goals)
-        prompt += self.format_memory(memory)
+        # Goal formatting stays a cached lookup (keyed on the goal tuple
+        # inside format_goals); only the tool list is pinned per registry.
+        goal_messages = self.format_goals(goals)
+
+        static_key = id(actions)
+        if self._static_parts is not None and self._static_parts[0] == static_key:
+            # Hot path: skip tool formatting after the first turn
+            _, tools = self._static_parts
+        else:
+            # The registry caches its formatted tool list across turns; fall
+            # back to per-call formatting when given a plain list of actions.
+            if isinstance(actions, ActionRegistry):
+                tools = actions.get_formatted_tools()
+            else:
+                tools = self.format_actions(actions)
+            self._static_parts = (static_key, tools)
 
-        tools = self.format_actions(actions)
+        prompt = list(goal_messages)
+        prompt += self.format_memory(memory)
 
         return Prompt(messages=prompt, tools=tools)
 
@@ -160,28 +187,41 @@ CRITICAL TOOL SELECTION GUIDELINES:
 
     # In language.py, update parse_response
 
-    def parse_response(self, response: str) -> dict:
+    def parse_response(self, response: str) -> dict | list:
         try:
-            # 1. First, try to parse the LLM's response as a tool call (JSON)
-            parsed = json.loads(response)
-            if "args" not in parsed or not isinstance(parsed["args"], dict):
-                parsed["args"] = {}
-            return parsed
+            # 1. First, try to parse the LLM's response as a tool call (JSON).
+            #    A JSON list means the LLM issued several tool calls at once.
+            parsed = orjson.loads(response)
+            if type(parsed) is list:
+                return [self._normalize_invocation(p) for p in parsed]
+            return self._normalize_invocation(parsed)
         except Exception:
             # 2. If JSON parsing fails (i.e., the LLM returned plain text),
-            #    force the agent to call the 'say' tool with the plain text.
+            #    force the agent to call the fallback tool with the plain text.
             return {
-                "tool": "say",  # <--- CHANGED FROM 'terminate' TO 'say'
+                "tool": self.FALLBACK_TOOL,
                 "args": {"message": response}
             }
 
+    @staticmethod
+    def _normalize_invocation(parsed: dict) -> dict:
+        # Single dict op for the common case; exact-type check is cheaper
+        # than isinstance here and JSON never yields dict subclasses
+        args = parsed.setdefault("args", {})
+        if type(args) is not dict:
+            parsed["args"] = {}
+        return parsed
+
 
 class PythonActionRegistry(ActionRegistry):
     def __init__(self, tags: List[str] = None, tool_names: List[str] = None):
         super().__init__()
 
         self.terminate_tool = None
-        
+
+        # Filter with C-implemented set operations rather than nested scans
+        tags_set = frozenset(tags) if tags else None
+
         # Collect tools based on tags/names
         tools_to_register = []
         for tool_name, tool_desc in tools.items():
@@ -189,8 +229,8 @@ class PythonActionRegistry(ActionRegistry):
                 self.terminate_tool = tool_desc
                 continue # Skip registering here, handle separately
 
-            tool_tags = tool_desc.get("tags", [])
-            if tags and not any(tag in tool_tags for tag in tags):
+            tool_tags_set = tool_desc.get("tags_set") or frozenset(tool_desc.get("tags", []))
+            if tags_set and tags_set.isdisjoint(tool_tags_set):
                 continue
 
             tools_to_register.append((tool_name, tool_desc))
@@ -208,6 +248,9 @@ class PythonActionRegistry(ActionRegistry):
         # 🔑 FIX: Ensure terminate tool is registered last
         self.register_terminate_tool()
 
+        # Registration is complete for the session — freeze the action set
+        self.finalize()
+
     def register_terminate_tool(self):
         if self.terminate_tool:
             self.register(Action(
@@ -1,4 +1,7 @@
-import os 
+import atexit
+import os
+import re
+import orjson
 from dotenv import load_dotenv
 from response_generator import generate_response
 from GAME import Goal, Memory, Environment
@@ -40,8 +43,47 @@ agent = Agent(
 )
 
 
-# Start interactive loop
-memory = Memory()
+# Precompiled intent patterns mirroring the tool-selection guide. When the
+# user's query is an obvious match, the tool call is synthesized locally and
+# the LLM round-trip is skipped entirely.
+_INTENT_PATTERNS = [
+    (re.compile(r"^how many (?:csv )?files? (?:from|of) (\w+)(?: in ([\w./-]+))?\??$", re.IGNORECASE),
+     lambda m: {"tool": "count_center_csv_files", "args": {"center_keyword": m.group(1), "path": m.group(2) or ""}}),
+    (re.compile(r"^list files? (?:from|of) (\w+)(?: in ([\w./-]+))?$", re.IGNORECASE),
+     lambda m: {"tool": "list_center_csv_files", "args": {"center_keyword": m.group(1), "path": m.group(2) or ""}}),
+    (re.compile(r"^(?:list|show) (?:all )?csvs?(?: in ([\w./-]+))?$", re.IGNORECASE),
+     lambda m: {"tool": "list_csv_files_in_dir", "args": {"path": m.group(1) or ""}}),
+    (re.compile(r"^(?:how many|count) csv files?(?: in ([\w./-]+))?\??$", re.IGNORECASE),
+     lambda m: {"tool": "count_csv_files", "args": {"path": m.group(1) or ""}}),
+    (re.compile(r"^clean all (?:csvs?|files?)(?: in ([\w./-]+))?$", re.IGNORECASE),
+     lambda m: {"tool": "clean_all_csv_files", "args": {"path": m.group(1) or ""}}),
+]
+
+
+def match_intent(user_input: str) -> str | None:
+    """Return a synthesized tool-call JSON for obvious queries, or None to defer to the LLM."""
+    text = user_input.strip()
+    for pattern, build_call in _INTENT_PATTERNS:
+        m = pattern.match(text)
+        if m:
+            return orjson.dumps(build_call(m)).decode()
+    return None
+
+
+# Start interactive loop, resuming the previous session's memory if a
+# snapshot exists; the memory is re-snapshotted on exit.
+SESSION_FILE = ".agent_session.pkl"
+
+if os.path.exists(SESSION_FILE):
+    try:
+        memory = Memory.load(SESSION_FILE)
+        print(f"(Resumed previous session with {len(memory.items)} memories)")
+    except Exception:
+        memory = Memory()
+else:
+    memory = Memory()
+
+atexit.register(memory.dump, SESSION_FILE)
 
 print("")
 print("")
@@ -55,18 +97,26 @@ while True:
         break
 
     agent.set_current_task(memory, user_input)
-    prompt = agent.construct_prompt(agent.goals, memory, agent.actions)
-    response = agent.prompt_llm_for_action(prompt)
-
-    action, invocation = agent.get_action(response)
-    result = agent.environment.execute_action(action, invocation["args"])
-
-    agent.update_memory(memory, response, result)
-    
-    if result.get("tool_executed"):
-        print(f"\n🤖 Agent: {result['result']}\n")
-    else:
-        print(f"\n🤖 Agent encountered an error:\n{result['error']}\n")
+
+    # Try the local intent matcher first; only fall back to the LLM when the
+    # query is not an obvious tool call.
+    response = match_intent(user_input)
+    if response is None:
+        prompt = agent.construct_prompt(agent.goals, memory, agent.actions)
+        response = agent.prompt_llm_for_action(prompt)
+
+    invocations = agent.get_invocations(response)
+    results = agent.environment.execute_actions(
+        [(action, invocation["args"]) for action, invocation in invocations]
+    )
+
+    agent.update_memory(memory, response, results)
+
+    for result in results:
+        if result.get("tool_executed"):
+            print(f"\n🤖 Agent: {result['result']}\n")
+        else:
+            print(f"\n🤖 Agent encountered an error:\n{result['error']}\n")
 
     if agent.should_terminate(response):
         print("Agent has decided to terminate.")
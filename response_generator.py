@@ -1,9 +1,12 @@
 from dataclasses import dataclass, field
-import json
+import hashlib
+import threading
+
+import orjson
 from langchain_cohere import ChatCohere
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from typing import List, Dict
+from typing import Any, Dict, List
 
 @dataclass
 class Prompt:
@@ -12,6 +15,62 @@ class Prompt:
     metadata: dict = field(default_factory=dict)  # Fixing mutable default issue
 
 
+# Reuse a single ChatCohere instance (and its HTTP client) across calls instead
+# of re-instantiating per turn. Tool bindings are cached per unique tool list.
+_LLM = None
+_TOOLBIND_CACHE: Dict[str, Any] = {}
+_LLM_LOCK = threading.Lock()
+
+# Persistent worker pool for timeout-guarded LLM calls. Creating a fresh
+# ThreadPoolExecutor per call pays thread create/join costs on every turn.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+
+def _get_llm():
+    """Return the shared ChatCohere instance, creating it on first use."""
+    global _LLM
+    if _LLM is None:
+        with _LLM_LOCK:
+            if _LLM is None:
+                _LLM = ChatCohere(
+                    model="command-a-03-2025",
+                    max_tokens=1024,
+                    temperature=0.3,
+                    timeout=30
+                )
+    return _LLM
+
+
+# Converted LangChain message objects, keyed by (role, content). The prompt
+# dicts are rebuilt each turn but prior turns' role/content never change, so
+# only newly appended messages miss the cache.
+_MSG_TYPES = {"system": SystemMessage, "user": HumanMessage, "assistant": AIMessage}
+_MSG_CACHE: Dict[tuple, Any] = {}
+
+
+def _to_langchain_message(role: str, content: str):
+    """Return the LangChain message object for a (role, content) pair, cached."""
+    key = (role, content)
+    message = _MSG_CACHE.get(key)
+    if message is None:
+        msg_type = _MSG_TYPES.get(role)
+        if msg_type is None:
+            return None
+        message = msg_type(content=content)
+        _MSG_CACHE[key] = message
+    return message
+
+
+def _get_llm_with_tools(formatted_tools):
+    """Return an llm bound to the given tools, reusing a cached binding when possible."""
+    key = hashlib.blake2b(orjson.dumps(formatted_tools, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    llm_with_tools = _TOOLBIND_CACHE.get(key)
+    if llm_with_tools is None:
+        llm_with_tools = _get_llm().bind_tools(formatted_tools)
+        _TOOLBIND_CACHE[key] = llm_with_tools
+    return llm_with_tools
+
+
 
 def generate_response(prompt: Prompt) -> str:
     """Call LLM to get response"""
@@ -19,35 +78,24 @@ def generate_response(prompt: Prompt) -> str:
     # print(f"DEBUG: Prompt has {len(prompt.messages)} messages and {len(prompt.tools)} tools")
 
     try:
-        # Initialize Cohere model with LangChain
-        llm = ChatCohere(
-            model="command-a-03-2025",
-            max_tokens=1024,
-            temperature=0.3,
-            timeout=30
-        )
-        # print("DEBUG: Cohere model initialized")
-
         messages = prompt.messages
         tools = prompt.tools
         result = None
 
-        # Convert dict messages to LangChain message objects
-        langchain_messages = []
-        for msg in messages:
-            if msg["role"] == "system":
-                langchain_messages.append(SystemMessage(content=msg["content"]))
-            elif msg["role"] == "user":
-                langchain_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                langchain_messages.append(AIMessage(content=msg["content"]))
+        # Convert dict messages to LangChain message objects (cached, so prior
+        # turns' messages are reused instead of reconstructed)
+        langchain_messages = [
+            lc_msg for msg in messages
+            if (lc_msg := _to_langchain_message(msg["role"], msg["content"])) is not None
+        ]
 
         # print(f"DEBUG: Converted {len(langchain_messages)} messages")
 
         if not tools:
-            # print("DEBUG: No tools, making simple invoke call")
-            response = llm.invoke(langchain_messages)
-            result = response.content
+            # Tool-free turns take the shortest path: the shared llm invoked
+            # directly, with none of the tool formatting/binding code reached
+            response = _get_llm().invoke(langchain_messages)
+            return response.content
         else:
             # print("DEBUG: Tools present, setting up tool calling")
 
@@ -63,39 +111,41 @@ def generate_response(prompt: Prompt) -> str:
                     }
                     formatted_tools.append(cohere_tool)
 
-            llm_with_tools = llm.bind_tools(formatted_tools)
+            llm_with_tools = _get_llm_with_tools(formatted_tools)
             # print("DEBUG: About to invoke LLM with tools (this may take 30-60 seconds)")
 
             def make_call():
                 return llm_with_tools.invoke(langchain_messages)
 
-            with ThreadPoolExecutor() as executor:
-                future = executor.submit(make_call)
-                try:
-                    response = future.result(timeout=60)
-                    # print("DEBUG: Got response from LLM with tools")
-                    if hasattr(response, "tool_calls"):
-                        response.tool_calls = [
-                            {
-                                "name": tc.get("name"),
-                                "args": tc.get("args") or {}
-                            }
-                            for tc in response.tool_calls
-                        ]
-
-                except FuturesTimeoutError:
-                    # print("DEBUG: LLM call timed out after 60 seconds")
-                    return "ERROR: LLM call timed out"
-
-            # 🔐 Sanitize tool calls to avoid None in args
+            future = _EXECUTOR.submit(make_call)
+            try:
+                response = future.result(timeout=60)
+                # print("DEBUG: Got response from LLM with tools")
+                if hasattr(response, "tool_calls"):
+                    response.tool_calls = [
+                        {
+                            "name": tc.get("name"),
+                            "args": tc.get("args") or {}
+                        }
+                        for tc in response.tool_calls
+                    ]
+
+            except FuturesTimeoutError:
+                # print("DEBUG: LLM call timed out after 60 seconds")
+                return "ERROR: LLM call timed out"
+
+            # 🔐 Sanitize tool calls to avoid None in args. A single call keeps
+            # the original {"tool", "args"} shape; multiple independent calls
+            # are returned as a JSON list so the agent can run them in a batch.
             if response.tool_calls:
-                tool_call = response.tool_calls[0]
-                args = tool_call.get("args") or {}  # default to empty dict if None
-                result = {
-                    "tool": tool_call["name"],
-                    "args": args,
-                }
-                result = json.dumps(result)
+                calls = [
+                    {
+                        "tool": tc["name"],
+                        "args": tc.get("args") or {},  # default to empty dict if None
+                    }
+                    for tc in response.tool_calls
+                ]
+                result = orjson.dumps(calls[0] if len(calls) == 1 else calls).decode()
             else:
                 result = response.content
 
@@ -112,7 +112,9 @@ def register_tool(tool_name=None, description=None, parameters_override=None, te
             "parameters": metadata["parameters"],
             "function": metadata["function"],
             "terminal": metadata["terminal"],
-            "tags": metadata["tags"] or []
+            "tags": metadata["tags"] or [],
+            # Precomputed for fast tag filtering (set ops instead of list scans)
+            "tags_set": frozenset(metadata["tags"] or [])
         }
 
         for tag in metadata["tags"]:
@@ -22,10 +22,4 @@ def say(message: str) -> str:
     Returns:
         The message to be displayed to the user.
     """
-    return message
-
-# Note: The existing 'terminate' tool is below this and remains terminal=True.
-@register_tool(tags=["system"], terminal=True)
-def terminate(message: str) -> str:
-    # ... (remains unchanged)
-    return f"{message}\nTerminating..."
\ No newline at end of file
+    return message
\ No newline at end of file